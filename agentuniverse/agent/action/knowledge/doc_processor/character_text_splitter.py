@@ -5,8 +5,14 @@
 # @Author  : fanen.lhy
 # @Email   : fanen.lhy@antgroup.com
 # @FileName: text_splitter.py
-from typing import List, Optional
-from langchain.text_splitter import CharacterTextSplitter as Splitter
+import copy
+import functools
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+import numpy as np
 
 from agentuniverse.agent.action.knowledge.doc_processor.doc_processor import \
     DocProcessor
@@ -15,25 +21,138 @@ from agentuniverse.agent.action.knowledge.store.query import Query
 from agentuniverse.base.config.component_configer.component_configer import \
     ComponentConfiger
 
+# re holds the GIL while splitting, so splitting docs in threads only pays
+# off on a free-threaded python build
+_GIL_DISABLED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+# the min doc count or total text size to split docs in the thread pool
+_PARALLEL_MIN_DOCS = 4
+_PARALLEL_MIN_TEXT_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _get_split_pool() -> ThreadPoolExecutor:
+    """Return the thread pool shared by all the splitters."""
+    return ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 4),
+                              thread_name_prefix='character_text_splitter')
+
+
+def _batch_len(texts: List[str]) -> List[int]:
+    """Measure a batch of texts in a single call."""
+    return list(map(len, texts))
+
+
+def _merge_indices(lengths, chunk_size: int, chunk_overlap: int,
+                   separator_len: int) -> np.ndarray:
+    """Compute the chunk windows of one document with the langchain text
+    splitter merge strategy.
+
+    Args:
+        lengths: The length of each split of the document.
+        chunk_size(int): The max size of a chunk.
+        chunk_overlap(int): The max overlap between two adjacent chunks.
+        separator_len(int): The length of the separator joining the splits.
+    Returns:
+        np.ndarray: A (n, 2) array, each row is a [start, end) split window.
+    """
+    n = len(lengths)
+    indices = np.empty((n + 1, 2), dtype=np.int64)
+    count = 0
+    start = 0
+    total = 0
+    for i in range(n):
+        length = lengths[i]
+        if total + length + (separator_len if i > start else 0) > chunk_size:
+            if i > start:
+                indices[count, 0] = start
+                indices[count, 1] = i
+                count += 1
+                # drop splits from the window head until it fits the overlap
+                # and leaves room for the current split
+                while total > chunk_overlap or (
+                        total + length + (separator_len if i > start else 0)
+                        > chunk_size and total > 0):
+                    total -= lengths[start] + (separator_len if i - start > 1 else 0)
+                    start += 1
+        total += length + (separator_len if i > start else 0)
+    indices[count, 0] = start
+    indices[count, 1] = n
+    count += 1
+    return indices[:count]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_merge_indices() -> Callable:
+    """Return the numba compiled _merge_indices if numba is installed,
+    otherwise the plain python one."""
+    try:
+        from numba import njit
+    except ImportError:
+        return _merge_indices
+    return njit(cache=True)(_merge_indices)
+
 
 class CharacterTextSplitter(DocProcessor):
     chunk_size: int = 200
     chunk_overlap: int = 20
     separator: str = "/n/n"
-    splitter: Optional[Splitter] = None
+    _sep_re: Optional[re.Pattern] = None
+    _splitter_params: Optional[tuple] = None
+    _length_fn_batch: Optional[Callable[[List[str]], List[int]]] = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.splitter = Splitter(separator=self.separator,
-                                 chunk_size=self.chunk_size,
-                                 chunk_overlap=self.chunk_overlap)
+        self._length_fn_batch = _batch_len
+
+    def _init_splitter(self):
+        """Check the chunk params and compile the separator pattern, only
+        when it is not built yet or the params changed since last build."""
+        splitter_params = (self.separator, self.chunk_size, self.chunk_overlap)
+        if self._sep_re is not None and splitter_params == self._splitter_params:
+            return
+        if self.chunk_overlap > self.chunk_size:
+            raise ValueError(f"Got a larger chunk overlap ({self.chunk_overlap}) than chunk size "
+                             f"({self.chunk_size}), should be smaller.")
+        self._sep_re = re.compile(re.escape(self.separator))
+        self._splitter_params = splitter_params
+
+    def _core_split(self, text: str) -> List[str]:
+        """Split the text by the separator, dropping the empty splits."""
+        return [split for split in self._sep_re.split(text) if split]
 
     def _process_docs(self, origin_docs: List[Document], query: Query = None) -> \
             List[Document]:
-        lc_doc_list = self.splitter.split_documents(Document.as_langchain_list(
-            origin_docs
-        ))
-        return Document.from_langchain_list(lc_doc_list)
+        self._init_splitter()
+        # split all docs first, then measure every split in one batch call
+        texts = [doc.text for doc in origin_docs]
+        if _GIL_DISABLED and (len(texts) >= _PARALLEL_MIN_DOCS
+                              or sum(map(len, texts)) >= _PARALLEL_MIN_TEXT_SIZE):
+            splits_list = list(_get_split_pool().map(self._core_split, texts))
+        else:
+            splits_list = [self._core_split(text) for text in texts]
+        offsets = [0]
+        for splits in splits_list:
+            offsets.append(offsets[-1] + len(splits))
+        flat_splits = [split for splits in splits_list for split in splits]
+        lengths = self._length_fn_batch(flat_splits)
+        return self._merge(origin_docs, flat_splits, lengths, offsets)
+
+    def _merge(self, origin_docs: List[Document], splits: List[str],
+               lengths: List[int], offsets: List[int]) -> List[Document]:
+        """Merge the flat splits into chunk documents, the splits of the i-th
+        document are splits[offsets[i]:offsets[i + 1]]."""
+        separator_len = self._length_fn_batch([self.separator])[0]
+        merge_indices = _get_merge_indices()
+        if merge_indices is not _merge_indices:
+            # the jit compiled version works on a typed integer array
+            lengths = np.asarray(lengths, dtype=np.int64)
+        docs = []
+        for doc, begin, end in zip(origin_docs, offsets, offsets[1:]):
+            for start, stop in merge_indices(lengths[begin:end], self.chunk_size,
+                                             self.chunk_overlap, separator_len):
+                chunk = self.separator.join(splits[begin + start:begin + stop]).strip()
+                if chunk:
+                    docs.append(Document(text=chunk, metadata=copy.deepcopy(doc.metadata)))
+        return docs
 
     def _initialize_by_component_configer(self,
                                          doc_processor_configer: ComponentConfiger) -> 'DocProcessor':
@@ -44,7 +163,4 @@ class CharacterTextSplitter(DocProcessor):
             self.chunk_overlap = doc_processor_configer.chunk_overlap
         if hasattr(doc_processor_configer, "separator"):
             self.separator = doc_processor_configer.separator
-        self.splitter = Splitter(separator=self.separator,
-                                 chunk_size=self.chunk_size,
-                                 chunk_overlap=self.chunk_overlap)
         return self
@@ -5,14 +5,69 @@
 # @Author  : wangchongshi
 # @Email   : wangchongshi.wcs@antgroup.com
 # @FileName: api_tool.py
+import functools
 import json
-from typing import Any, Optional
-from urllib.parse import urlencode
+import re
+from typing import Any, Callable, Optional
 import httpx
+import orjson
 
 from agentuniverse.agent.action.tool.tool import Tool, ToolInput
 from agentuniverse.agent.action.tool.utils import ssrf_proxy
 from agentuniverse.base.config.component_configer.configers.tool_configer import ToolConfiger
+from agentuniverse.base.util.logging.logging_util import LOGGER
+
+# matches the `{name}` path parameter placeholders in the api url
+_PATH_PARAM_RE = re.compile(r'\{([^{}]+)\}')
+
+# string values accepted as booleans
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+_FALSE_VALUES = frozenset({'false', '0', 'no', 'off'})
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _to_null(value: Any) -> None:
+    return None
+
+
+def _to_number(value: Any) -> int | float:
+    # check if it is a float
+    return float(value) if '.' in str(value) else int(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).lower()
+    if text in _TRUE_VALUES:
+        return True
+    elif text in _FALSE_VALUES:
+        return False
+    raise ValueError(f'Invalid boolean value {value}')
+
+
+def _to_object(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+# openapi property type -> value converter, a converter raises ValueError if the value cannot be converted
+_TYPE_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    'integer': int,
+    'int': int,
+    'number': _to_number,
+    'string': str,
+    'boolean': _to_bool,
+    'null': _to_null,
+    'object': _to_object,
+}
 
 
 class APITool(Tool):
@@ -22,18 +77,60 @@ class APITool(Tool):
         openapi_spec(str): The openapi schema of the api tool.
     """
     openapi_spec: Optional[dict] = None
+    _compiled_params: Optional[list] = None
+    _compiled_body: Optional[list] = None
+    _body_content_type: Optional[str] = None
 
     def execute(self, tool_input: ToolInput):
         res = self.do_http_request(self.openapi_spec.get('url'), self.openapi_spec.get('method'), {},
                                    tool_input.to_dict())
         return res.text
 
+    async def async_execute(self, tool_input: ToolInput):
+        res = await self.async_do_http_request(self.openapi_spec.get('url'), self.openapi_spec.get('method'), {},
+                                               tool_input.to_dict())
+        return res.text
+
     def initialize_by_component_configer(self, component_configer: ToolConfiger) -> 'APITool':
         super().initialize_by_component_configer(component_configer)
         if component_configer.__dict__['openapi_spec']:
             self.openapi_spec = component_configer.__dict__['openapi_spec']
+            try:
+                self.compile_openapi_spec()
+            except Exception as e:
+                # a malformed spec fails the requests of the tool, not its registration,
+                # the spec is compiled again and raises on the first request
+                LOGGER.warning(f"Failed to compile the openapi spec of the api tool {self.name}: {e}")
         return self
 
+    def compile_openapi_spec(self) -> None:
+        """Flatten the parameters and the request body schema of the openapi spec once,
+        so that each http request does not walk the spec again."""
+        compiled_params = [
+            (parameter['name'], parameter['in'], parameter.get('required', False),
+             (parameter.get('schema', {}) or {}).get('default', None))
+            for parameter in (self.openapi_spec.get('operation') or {}).get('parameters', [])
+        ]
+        compiled_body = []
+        body_content_type = None
+        request_body = self.openapi_spec.get('requestBody')
+        if request_body is not None and 'content' in request_body:
+            # only the first content type of the request body is used
+            for content_type, content in request_body['content'].items():
+                body_schema = content['schema']
+                required = body_schema.get('required', [])
+                body_content_type = content_type
+                compiled_body = [
+                    (name, name in required, property.get('default', None),
+                     self.get_body_property_converter(property))
+                    for name, property in body_schema.get('properties', {}).items()
+                ]
+                break
+        self._compiled_body = compiled_body
+        self._body_content_type = body_content_type
+        # set last, a spec is only marked as compiled when all of it compiled
+        self._compiled_params = compiled_params
+
     def convert_body_property_any_of(self, property: dict[str, Any], value: Any, any_of: list[dict[str, Any]],
                                      max_recursive=10) -> Any:
         """Convert a property value based on its anyOf type."""
@@ -53,13 +150,8 @@ class APITool(Tool):
                     elif option['type'] == 'string':
                         return str(value)
                     elif option['type'] == 'boolean':
-                        if str(value).lower() in ['true', '1']:
-                            return True
-                        elif str(value).lower() in ['false', '0']:
-                            return False
-                        else:
-                            # Not a boolean, try next option
-                            continue
+                        # raises ValueError if it is not a boolean, then the next option is tried
+                        return _to_bool(value)
                     elif option['type'] == 'null' and not value:
                         return None
                     else:
@@ -73,41 +165,19 @@ class APITool(Tool):
                 continue
         return value
 
+    def get_body_property_converter(self, property: dict[str, Any]) -> Callable[[Any], Any]:
+        """Get the value converter of a property based on its type."""
+        if 'type' in property:
+            return _TYPE_CONVERTERS.get(property['type'], _passthrough)
+        elif 'anyOf' in property and isinstance(property['anyOf'], list):
+            return functools.partial(self.convert_body_property_any_of, property, any_of=property['anyOf'])
+        return _passthrough
+
     def convert_body_property_type(self, property: dict[str, Any], value: Any) -> Any:
         """Convert a property value based on its type."""
         try:
-            if 'type' in property:
-                if property['type'] == 'integer' or property['type'] == 'int':
-                    return int(value)
-                elif property['type'] == 'number':
-                    # check if it is a float
-                    if '.' in value:
-                        return float(value)
-                    else:
-                        return int(value)
-                elif property['type'] == 'string':
-                    return str(value)
-                elif property['type'] == 'boolean':
-                    return bool(value)
-                elif property['type'] == 'null':
-                    if value is None:
-                        return None
-                elif property['type'] == 'object':
-                    if isinstance(value, str):
-                        try:
-                            return json.loads(value)
-                        except ValueError:
-                            return value
-                    elif isinstance(value, dict):
-                        return value
-                    else:
-                        return value
-                else:
-                    raise ValueError(
-                        f"Invalid type {property['type']} for property {property}")
-            elif 'anyOf' in property and isinstance(property['anyOf'], list):
-                return self.convert_body_property_any_of(property, value, property['anyOf'])
-        except ValueError as e:
+            return self.get_body_property_converter(property)(value)
+        except ValueError:
             return value
 
     def do_http_request(self, url: str, method: str, headers: dict[str, Any],
@@ -123,71 +193,102 @@ class APITool(Tool):
         Returns:
             httpx.Response: The response from the request.
         """
+        method, url, request_kwargs = self.build_http_request(url, method, headers, parameters)
+        return ssrf_proxy.make_request(method, url, **request_kwargs)
+
+    async def async_do_http_request(self, url: str, method: str, headers: dict[str, Any],
+                                    parameters: dict[str, Any]) -> httpx.Response:
+        """Asynchronously do an HTTP request.
+
+        Args:
+            url (str): The URL to request.
+            method (str): The HTTP method to use.
+            headers (dict[str, Any]): The headers to include in the request.
+            parameters (dict[str, Any]): The parameters to include in the request.
+
+        Returns:
+            httpx.Response: The response from the request.
+        """
+        method, url, request_kwargs = self.build_http_request(url, method, headers, parameters)
+        return await ssrf_proxy.async_make_request(method, url, **request_kwargs)
+
+    def build_http_request(self, url: str, method: str, headers: dict[str, Any],
+                           parameters: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
+        """Build the method, url and request arguments of an HTTP request from the openapi spec.
+
+        Args:
+            url (str): The URL to request.
+            method (str): The HTTP method to use.
+            headers (dict[str, Any]): The headers to include in the request.
+            parameters (dict[str, Any]): The parameters to include in the request.
+
+        Returns:
+            tuple[str, str, dict[str, Any]]: The HTTP method, the URL and the request arguments.
+        """
+        if self._compiled_params is None:
+            self.compile_openapi_spec()
         method = method.lower()
         params = {}
         path_params = {}
         body = {}
         cookies = {}
         # check parameters
-        for parameter in self.openapi_spec.get('operation').get('parameters', []):
-            value = self.get_parameter_value(parameter, parameters)
+        for name, location, required, default in self._compiled_params:
+            if name in parameters:
+                value = parameters[name]
+            elif required:
+                raise Exception(f"Missing required parameter {name}")
+            else:
+                value = default
             if value is not None:
-                if parameter['in'] == 'path':
-                    path_params[parameter['name']] = value
+                if location == 'path':
+                    path_params[name] = value
 
-                elif parameter['in'] == 'query':
-                    params[parameter['name']] = value
+                elif location == 'query':
+                    params[name] = value
 
-                elif parameter['in'] == 'cookie':
-                    cookies[parameter['name']] = value
+                elif location == 'cookie':
+                    cookies[name] = value
 
-                elif parameter['in'] == 'header':
-                    headers[parameter['name']] = value
+                elif location == 'header':
+                    headers[name] = value
 
         # check if there is a request body and handle it
-        if 'requestBody' in self.openapi_spec and self.openapi_spec['requestBody'] is not None:
-            # handle json request body
-            if 'content' in self.openapi_spec['requestBody']:
-                for content_type in self.openapi_spec['requestBody']['content']:
-                    headers['Content-Type'] = content_type
-                    body_schema = self.openapi_spec[
-                        'requestBody']['content'][content_type]['schema']
-                    required = body_schema.get('required', [])
-                    properties = body_schema.get('properties', {})
-                    for name, property in properties.items():
-                        if name in parameters:
-                            # convert type
-                            body[name] = self.convert_body_property_type(
-                                property, parameters[name])
-                        elif name in required:
-                            raise Exception(
-                                f"Missing required parameter {name} in operation {self.plugin_api_model.operation_id}"
-                            )
-                        elif 'default' in property:
-                            body[name] = property['default']
-                        else:
-                            body[name] = None
-                    break
+        if self._body_content_type is not None:
+            headers['Content-Type'] = self._body_content_type
+            body = self.convert_body_properties(parameters)
 
         # replace path parameters
-        for name, value in path_params.items():
-            url = url.replace(f'{{{name}}}', f'{value}')
-
-        # parse http body data if needed, for GET/HEAD/OPTIONS/TRACE
-        if 'Content-Type' in headers:
-            if headers['Content-Type'] == 'application/json':
-                body = json.dumps(body)
-            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
-                body = urlencode(body)
-            else:
-                body = body
+        if path_params:
+            url = _PATH_PARAM_RE.sub(lambda m: str(path_params.get(m.group(1), m.group(0))), url)
+
         if method in ('get', 'head', 'post', 'put', 'delete', 'patch'):
-            response = getattr(ssrf_proxy, method)(url, params=params, headers=headers, data=body,
-                                                   follow_redirects=True)
-            return response
+            request_kwargs = {'params': params, 'headers': headers, 'follow_redirects': True}
+            # let httpx encode the body according to its content type
+            if self._body_content_type == 'application/json':
+                request_kwargs['json'] = body
+            elif self._body_content_type is not None:
+                request_kwargs['data'] = body
+            return method.upper(), url, request_kwargs
         else:
             raise ValueError(f'Invalid http method')
 
+    def convert_body_properties(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Convert the body parameters property by property."""
+        body = {}
+        for name, required, default, converter in self._compiled_body:
+            if name in parameters:
+                # convert type
+                try:
+                    body[name] = converter(parameters[name])
+                except ValueError:
+                    body[name] = parameters[name]
+            elif required:
+                raise Exception(f"Missing required parameter {name} in operation {self.name}")
+            else:
+                body[name] = default
+        return body
+
     @staticmethod
     def get_parameter_value(parameter, parameters):
         if parameter['name'] in parameters:
@@ -198,8 +299,12 @@ class APITool(Tool):
             return (parameter.get('schema', {}) or {}).get('default', None)
 
     @staticmethod
-    def validate_and_parse_response(response: httpx.Response) -> str:
-        """Validate and parse the response from the tool response."""
+    def validate_and_parse_response(response: httpx.Response) -> Any:
+        """Validate and parse the response from the tool response.
+
+        Returns:
+            Any: The parsed python object of a json response, or the text of a non-json response.
+        """
         if isinstance(response, httpx.Response):
             if response.status_code >= 400:
                 raise Exception(
@@ -207,12 +312,19 @@ class APITool(Tool):
             if not response.content:
                 return 'Empty response from the tool, please check your parameters and try again.'
             try:
-                response = response.json()
-                try:
-                    return json.dumps(response, ensure_ascii=False)
-                except Exception as e:
-                    return json.dumps(response)
-            except Exception as e:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 return response.text
         else:
             raise ValueError(f'Invalid response type {type(response)}')
+
+    @staticmethod
+    def validate_and_parse_response_text(response: httpx.Response) -> str:
+        """Validate and parse the response from the tool response into a json string."""
+        res = APITool.validate_and_parse_response(response)
+        if isinstance(res, str):
+            return res
+        try:
+            return orjson.dumps(res).decode()
+        except orjson.JSONEncodeError:
+            return response.text
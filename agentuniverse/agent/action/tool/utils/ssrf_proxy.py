@@ -5,7 +5,10 @@
 # @Author  : sunshinesmilelk
 # @Email   : ximo.lk@antgroup.com
 # @FileName: ssrf_proxy.py
+import asyncio
+import importlib.util
 import os
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 import httpx
 
 SSRF_PROXY_ALL_URL = os.getenv('SSRF_PROXY_ALL_URL', '')
@@ -17,14 +20,61 @@ proxies = {
     'https://': SSRF_PROXY_HTTPS_URL
 } if SSRF_PROXY_HTTP_URL and SSRF_PROXY_HTTPS_URL else None
 
+# http2 needs the optional `h2` package (httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
+TIMEOUT = 20
+LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
 
-def make_request(method, url, **kwargs):
+
+def _client_kwargs(transport_clz) -> dict:
+    """Return the shared client settings, with the same proxy rules for the sync and async clients."""
+    # the clients are shared by all tools and sessions, so a cookie set by one response
+    # must never be stored and sent with later requests, the jar policy rejects every cookie
+    kwargs = {'timeout': TIMEOUT, 'http2': HTTP2_ENABLED, 'limits': LIMITS,
+              'cookies': CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))}
     if SSRF_PROXY_ALL_URL:
-        return httpx.request(method=method, url=url, proxy=SSRF_PROXY_ALL_URL, timeout=20, **kwargs)
+        kwargs['proxy'] = SSRF_PROXY_ALL_URL
     elif proxies:
-        return httpx.request(method=method, url=url, proxies=proxies, timeout=20, **kwargs)
-    else:
-        return httpx.request(method=method, url=url, timeout=20, **kwargs)
+        kwargs['mounts'] = {scheme: transport_clz(proxy=proxy_url, http2=HTTP2_ENABLED, limits=LIMITS)
+                            for scheme, proxy_url in proxies.items()}
+    return kwargs
+
+
+# a persistent client, so that requests to the same host reuse the pooled connections
+client = httpx.Client(**_client_kwargs(httpx.HTTPTransport))
+
+# async connection pools are bound to the event loop they are created in, so keep one client per loop,
+# together with the async generator that closes it
+_async_clients: dict[asyncio.AbstractEventLoop, tuple] = {}
+
+
+async def _hold_async_client(loop: asyncio.AbstractEventLoop, async_client: httpx.AsyncClient):
+    """Hold the async client of the loop until the loop shuts down its async generators
+    (asyncio.run does on exit), then close the pooled connections of the client."""
+    try:
+        yield async_client
+    finally:
+        _async_clients.pop(loop, None)
+        await async_client.aclose()
+
+
+async def get_async_client() -> httpx.AsyncClient:
+    """Return the persistent async client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _async_clients:
+        async_client = httpx.AsyncClient(**_client_kwargs(httpx.AsyncHTTPTransport))
+        holder = _hold_async_client(loop, async_client)
+        _async_clients[loop] = (async_client, holder)
+        await holder.__anext__()
+    return _async_clients[loop][0]
+
+
+def make_request(method, url, **kwargs):
+    return client.request(method=method, url=url, **kwargs)
+
+
+async def async_make_request(method, url, **kwargs):
+    return await (await get_async_client()).request(method=method, url=url, **kwargs)
 
 
 def get(url, **kwargs):
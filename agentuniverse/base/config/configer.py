@@ -12,6 +12,9 @@ import yaml
 
 from agentuniverse.base.config.config_type_enum import ConfigTypeEnum
 
+# Prefer the libyaml based safe loader, fall back to the pure python one when PyYAML is built without libyaml.
+YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class Configer(object):
     """Configger object, responsible for the configuration file load, update, etc."""
@@ -159,5 +162,6 @@ class Configer(object):
             dict: the value of the yaml file
         """
         with open(path, 'r', encoding='utf-8') as stream:
-            config_data = yaml.safe_load(stream)
+            # YAML_SAFE_LOADER is the C or the python SafeLoader
+            config_data = yaml.load(stream, Loader=YAML_SAFE_LOADER)  # noqa: S506
         return config_data
@@ -23,6 +23,9 @@ class Prompt(ComponentBase):
     prompt_version: Optional[str] = None
     prompt_template: Optional[str] = None
     input_variables: Optional[list[str]] = None
+    introduction: Optional[str] = ''
+    target: Optional[str] = ''
+    instruction: Optional[str] = ''
 
     def __init__(self, **kwargs):
         super().__init__(component_type=ComponentEnum.PROMPT, **kwargs)
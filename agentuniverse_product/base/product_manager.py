@@ -17,3 +17,36 @@ class ProductManager(ComponentManagerBase[Product]):
 
     def __init__(self):
         super().__init__(ComponentEnum.PRODUCT)
+        # The product index grouped by product type, which is used to avoid a full scan of the product pool.
+        # _type_instance_obj_map - Format: {product_type: {component_instance_name: product_instance_obj}}.
+        self._type_instance_obj_map: dict[str, dict[str, Product]] = {}
+        # A monotonic counter increased on every product change, used to invalidate the product caches.
+        self._version: int = 0
+
+    @property
+    def version(self) -> int:
+        """Return the version of the product pool."""
+        return self._version
+
+    def increase_version(self):
+        """Increase the version of the product pool, called when a product or its instance is updated in place."""
+        self._version += 1
+
+    def register(self, component_instance_name: str, component_instance_obj: Product):
+        """Register the product instance and index it by the product type."""
+        super().register(component_instance_name, component_instance_obj)
+        self.increase_version()
+        self._type_instance_obj_map.setdefault(component_instance_obj.type, {})[
+            component_instance_name] = component_instance_obj
+
+    def unregister(self, component_instance_name: str):
+        """Unregister the product instance and remove it from the product type index."""
+        product: Product = self._instance_obj_map.get(component_instance_name)
+        super().unregister(component_instance_name)
+        self.increase_version()
+        if product is not None:
+            self._type_instance_obj_map.get(product.type, {}).pop(component_instance_name, None)
+
+    def get_instance_obj_list_by_type(self, product_type: str) -> list[Product]:
+        """Return the product instance object list of the given product type."""
+        return list(self._type_instance_obj_map.get(product_type, {}).values())
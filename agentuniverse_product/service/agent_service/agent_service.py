@@ -31,6 +31,14 @@ from agentuniverse_product.service.util.agent_util import validate_create_agent_
     assemble_product_config_data, assemble_agent_config_data, assemble_agent_dto, update_agent_product_config, \
     update_agent_config, register_agent, register_product, validate_and_assemble_agent_input
 
+# bind the singleton managers once instead of resolving them on every call
+_PRODUCT_MGR = ProductManager()
+_AGENT_MGR = AgentManager()
+
+# The assembled agent detail cache.
+# _DETAIL_CACHE - Format: {agent_id: (product_pool_version, agent_dto)}.
+_DETAIL_CACHE: dict[str, tuple[int, AgentDTO]] = {}
+
 
 class AgentService:
     """Agent Service for aU-product."""
@@ -43,17 +51,14 @@ class AgentService:
             List[AgentDTO]: List of AgentDTOs.
         """
         res = []
-        product_list: List[Product] = ProductManager().get_instance_obj_list()
-        if len(product_list) < 1:
-            return res
+        product_list: List[Product] = _PRODUCT_MGR.get_instance_obj_list_by_type(ComponentEnum.AGENT.value)
         for product in product_list:
-            if product.type == ComponentEnum.AGENT.value:
-                agent_dto = AgentDTO(nickname=product.nickname, avatar=product.avatar, id=product.id,
-                                     opening_speech=product.opening_speech, mtime=product.get_mtime())
-                agent = product.instance
-                agent_model: AgentModel = agent.agent_model
-                agent_dto.description = agent_model.info.get('description', '')
-                res.append(agent_dto)
+            agent_dto = AgentDTO(nickname=product.nickname, avatar=product.avatar, id=product.id,
+                                 opening_speech=product.opening_speech, mtime=product.get_mtime())
+            agent = product.instance
+            agent_model: AgentModel = agent.agent_model
+            agent_dto.description = agent_model.info.get('description', '')
+            res.append(agent_dto)
         return res
 
     @staticmethod
@@ -63,14 +68,34 @@ class AgentService:
         Returns:
             AgentDTO | None: AgentDTO or None.
         """
-        product: Product = ProductManager().get_instance_obj(id)
-        agent: Agent = AgentManager().get_instance_obj(id)
+        version = _PRODUCT_MGR.version
+        cached = _DETAIL_CACHE.get(id)
+        if cached is None or cached[0] != version:
+            agent_dto = AgentService.build_agent_detail(id)
+            if agent_dto is None:
+                return None
+            cached = (version, agent_dto)
+            _DETAIL_CACHE[id] = cached
+        # return a copy, so that the caller cannot modify the cached dto
+        return cached[1].model_copy(deep=True)
+
+    @staticmethod
+    def build_agent_detail(id: str) -> AgentDTO | None:
+        """Build agent detail by agent id.
+
+        Returns:
+            AgentDTO | None: AgentDTO or None.
+        """
+        product: Product = _PRODUCT_MGR.get_instance_obj(id)
+        if product is None or product.type != ComponentEnum.AGENT.value:
+            return None
+        agent: Agent = _AGENT_MGR.get_instance_obj(id)
         if agent is None:
             raise ValueError("The agent instance corresponding to the agent id cannot be found.")
         agent_dto = AgentDTO(id=id,
-                             nickname=product.nickname if product else '',
-                             avatar=product.avatar if product else '',
-                             opening_speech=product.opening_speech if product else '',
+                             nickname=product.nickname,
+                             avatar=product.avatar,
+                             opening_speech=product.opening_speech,
                              mtime=product.get_mtime())
         # assemble agent dto
         return assemble_agent_dto(agent, agent_dto)
@@ -80,15 +105,19 @@ class AgentService:
         """Update agent detail."""
         if agent_dto.id is None:
             raise ValueError("Agent id cannot be None.")
-        product: Product = ProductManager().get_instance_obj(agent_dto.id)
-        agent: Agent = AgentManager().get_instance_obj(agent_dto.id)
+        product: Product = _PRODUCT_MGR.get_instance_obj(agent_dto.id)
+        agent: Agent = _AGENT_MGR.get_instance_obj(agent_dto.id)
         if agent is None:
             raise ValueError("The agent instance corresponding to the agent id cannot be found.")
-        # update agent product yaml configuration file
-        if product:
-            update_agent_product_config(product, agent_dto, product.component_config_path)
-        # update agent yaml configuration file
-        update_agent_config(agent, agent_dto, agent.component_config_path)
+        try:
+            # update agent product yaml configuration file
+            if product:
+                update_agent_product_config(product, agent_dto, product.component_config_path)
+            # update agent yaml configuration file
+            update_agent_config(agent, agent_dto, agent.component_config_path)
+        finally:
+            # invalidate the cached agent details, the instances may be updated even if writing yaml fails
+            _PRODUCT_MGR.increase_version()
 
     @staticmethod
     def chat(agent_id: str, session_id: str, input: str) -> dict:
@@ -103,7 +132,7 @@ class AgentService:
         """
         if agent_id is None or session_id is None:
             raise ValueError("Agent id or session id cannot be None.")
-        agent: Agent = AgentManager().get_instance_obj(agent_id)
+        agent: Agent = _AGENT_MGR.get_instance_obj(agent_id)
         if agent is None:
             raise ValueError("The agent instance corresponding to the agent id cannot be found.")
 
@@ -115,14 +115,18 @@ class KnowledgeService:
         knowledge_updated_fields = {key: value for key, value in knowledge_update_config.items() if value is not None}
         product_updated_fields = {key: value for key, value in product_update_config.items() if value is not None}
 
-        # set knowledge attributes
-        for key, value in knowledge_updated_fields.items():
-            setattr(knowledge, key, value)
-        for key, value in product_updated_fields.items():
-            setattr(product, key, value)
-
-        update_nested_yaml_value(knowledge.component_config_path, knowledge_updated_fields)
-        update_nested_yaml_value(product.component_config_path, product_updated_fields)
+        try:
+            # set knowledge attributes
+            for key, value in knowledge_updated_fields.items():
+                setattr(knowledge, key, value)
+            for key, value in product_updated_fields.items():
+                setattr(product, key, value)
+
+            update_nested_yaml_value(knowledge.component_config_path, knowledge_updated_fields)
+            update_nested_yaml_value(product.component_config_path, product_updated_fields)
+        finally:
+            # invalidate the cached product details, the instances are updated even if writing yaml fails
+            ProductManager().increase_version()
 
         return knowledge_dto.id
 
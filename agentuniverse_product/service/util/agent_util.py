@@ -36,6 +36,14 @@ from agentuniverse_product.service.model.planner_dto import PlannerDTO
 from agentuniverse_product.service.model.prompt_dto import PromptDTO
 from agentuniverse_product.service.model.tool_dto import ToolDTO
 
+# bind the singleton managers once instead of resolving them on every call
+_PRODUCT_MGR = ProductManager()
+_AGENT_MGR = AgentManager()
+_TOOL_MGR = ToolManager()
+_LLM_MGR = LLMManager()
+_PROMPT_MGR = PromptManager()
+_KNOWLEDGE_MGR = KnowledgeManager()
+
 
 def assemble_product_config_data(agent_dto: AgentDTO) -> Dict:
     """Assemble the agent product configuration data.
@@ -68,7 +76,7 @@ def validate_create_agent_parameters(agent_dto: AgentDTO) -> None:
     """
     if agent_dto.id is None:
         raise ValueError("Agent id cannot be None.")
-    agent = AgentManager().get_instance_obj(agent_dto.id)
+    agent = _AGENT_MGR.get_instance_obj(agent_dto.id)
     if agent:
         raise ValueError("Agent instance corresponding to the agent id already exists.")
     if agent_dto.planner is None:
@@ -105,7 +113,7 @@ def assemble_agent_config_data(agent_dto: AgentDTO) -> Dict:
     }
 
     if agent_dto.llm:
-        llm = LLMManager().get_instance_obj(agent_dto.llm.id)
+        llm = _LLM_MGR.get_instance_obj(agent_dto.llm.id)
         if llm is None:
             raise ValueError("The llm instance corresponding to the llm id cannot be found.")
         llm_model_dict = {'name': agent_dto.llm.id}
@@ -154,7 +162,7 @@ def register_agent(file_path: str):
     component_clz = ComponentConfigerUtil.get_component_object_clz_by_component_configer(agent_configer)
     component_instance: Agent = component_clz().initialize_by_component_configer(agent_configer)
     component_instance.component_config_path = component_configer.configer.path
-    AgentManager().register(component_instance.get_instance_code(), component_instance)
+    _AGENT_MGR.register(component_instance.get_instance_code(), component_instance)
 
 
 def register_product(file_path: str):
@@ -170,7 +178,7 @@ def register_product(file_path: str):
     component_clz = ComponentConfigerUtil.get_component_object_clz_by_component_configer(product_configer)
     component_instance: Product = component_clz().initialize_by_component_configer(product_configer)
     component_instance.component_config_path = component_configer.configer.path
-    ProductManager().register(component_instance.get_instance_code(), component_instance)
+    _PRODUCT_MGR.register(component_instance.get_instance_code(), component_instance)
 
 
 def unregister_product(file_path: str):
@@ -185,7 +193,7 @@ def unregister_product(file_path: str):
     product_configer: ProductConfiger = ProductConfiger().load_by_configer(component_configer.configer)
     component_clz = ComponentConfigerUtil.get_component_object_clz_by_component_configer(product_configer)
     component_instance: Product = component_clz().initialize_by_component_configer(product_configer)
-    ProductManager().unregister(component_instance.get_instance_code())
+    _PRODUCT_MGR.unregister(component_instance.get_instance_code())
 
 
 def assemble_agent_dto(agent: Agent, agent_dto: AgentDTO) -> AgentDTO:
@@ -208,7 +216,7 @@ def get_planner_dto(agent_model: AgentModel) -> PlannerDTO | None:
     workflow_id = planner.get('workflow_id')
     if planner_name is None:
         return None
-    product: Product = ProductManager().get_instance_obj(planner_name)
+    product: Product = _PRODUCT_MGR.get_instance_obj(planner_name)
 
     members = None
     if getattr(product, 'member_keys', None):
@@ -225,8 +233,8 @@ def get_knowledge_dto_list(agent_model: AgentModel) -> List[KnowledgeDTO]:
     if not knowledge_name_list:
         return res
     for knowledge_name in knowledge_name_list:
-        product: Product = ProductManager().get_instance_obj(knowledge_name)
-        knowledge: Knowledge = KnowledgeManager().get_instance_obj(knowledge_name)
+        product: Product = _PRODUCT_MGR.get_instance_obj(knowledge_name)
+        knowledge: Knowledge = _KNOWLEDGE_MGR.get_instance_obj(knowledge_name)
         if knowledge is None:
             continue
         knowledge_dto = KnowledgeDTO(nickname=product.nickname if product else '', id=knowledge_name)
@@ -242,8 +250,8 @@ def get_tool_dto_list(agent_model: AgentModel) -> List[ToolDTO]:
     if len(tool_name_list) < 1:
         return res
     for tool_name in tool_name_list:
-        product: Product = ProductManager().get_instance_obj(tool_name)
-        tool: Tool = ToolManager().get_instance_obj(tool_name)
+        product: Product = _PRODUCT_MGR.get_instance_obj(tool_name)
+        tool: Tool = _TOOL_MGR.get_instance_obj(tool_name)
         tool_dto = ToolDTO(nickname=product.nickname if product is not None else '',
                            avatar=product.avatar if product is not None else '',
                            id=tool.name)
@@ -260,13 +268,13 @@ def get_prompt_dto(agent_model: AgentModel) -> PromptDTO | None:
         instruction=agent_model.profile.get('instruction'))
 
     prompt_version = agent_model.profile.get('prompt_version')
-    version_prompt: Prompt = PromptManager().get_instance_obj(prompt_version)
+    version_prompt: Prompt = _PROMPT_MGR.get_instance_obj(prompt_version)
 
     if version_prompt:
         version_prompt_model: AgentPromptModel = AgentPromptModel(
-            introduction=getattr(version_prompt, 'introduction', ''),
-            target=getattr(version_prompt, 'target', ''),
-            instruction=getattr(version_prompt, 'instruction', ''))
+            introduction=version_prompt.introduction,
+            target=version_prompt.target,
+            instruction=version_prompt.instruction)
         profile_prompt_model = profile_prompt_model + version_prompt_model
     if not profile_prompt_model:
         return None
@@ -278,8 +286,8 @@ def get_llm_dto(agent_model: AgentModel) -> LlmDTO | None:
     """Get llm dto from agent."""
     llm_model = agent_model.profile.get('llm_model', {})
     llm_id = llm_model.get('name')
-    llm: LLM = LLMManager().get_instance_obj(llm_id)
-    product: Product = ProductManager().get_instance_obj(llm_id)
+    llm: LLM = _LLM_MGR.get_instance_obj(llm_id)
+    product: Product = _PRODUCT_MGR.get_instance_obj(llm_id)
     if llm is None:
         return None
     llm_model_name = llm_model.get('model_name') if llm_model.get('model_name') else llm.model_name
@@ -321,8 +329,8 @@ def assemble_planner_members(planner: dict, member_keys: List[str]) -> List[Agen
         if isinstance(current_value, list):
             for val in current_value:
                 # assemble each agent instance
-                agent: Agent = AgentManager().get_instance_obj(val)
-                product: Product = ProductManager().get_instance_obj(val)
+                agent: Agent = _AGENT_MGR.get_instance_obj(val)
+                product: Product = _PRODUCT_MGR.get_instance_obj(val)
                 if agent:
                     agent_dto = AgentDTO(id=val, nickname=product.nickname if product else '',
                                          avatar=product.avatar if product else '')
@@ -394,7 +402,7 @@ def assemble_tool_input(agent: Agent, agent_input: str) -> dict:
     tool_id_list = agent.agent_model.action.get('tool', [])
     tool_input_dict = {}
     for tool_id in tool_id_list:
-        tool: Tool = ToolManager().get_instance_obj(tool_id)
+        tool: Tool = _TOOL_MGR.get_instance_obj(tool_id)
         if tool is None:
             continue
         if len(tool.input_keys) > 0:
@@ -417,7 +425,7 @@ def validate_and_assemble_agent_input(agent_id: str, session_id: str, input: str
     """
     if agent_id is None or session_id is None:
         raise ValueError("Agent id or session id cannot be None.")
-    agent: Agent = AgentManager().get_instance_obj(agent_id)
+    agent: Agent = _AGENT_MGR.get_instance_obj(agent_id)
     if agent is None:
         raise ValueError("The agent instance corresponding to the agent id cannot be found.")
     tool_input_dict = assemble_tool_input(agent, input)
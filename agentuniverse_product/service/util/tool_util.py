@@ -16,6 +16,9 @@ from agentuniverse.base.config.component_configer.configers.tool_configer import
 from agentuniverse.base.config.configer import Configer
 from agentuniverse_product.service.model.tool_dto import ToolDTO
 
+# bind the singleton managers once instead of resolving them on every call
+_TOOL_MGR = ToolManager()
+
 
 def validate_create_api_tool_parameters(tool_dto: ToolDTO) -> None:
     """Validate the parameters for creating an api tool instance.
@@ -25,7 +28,7 @@ def validate_create_api_tool_parameters(tool_dto: ToolDTO) -> None:
     """
     if tool_dto.id is None:
         raise ValueError("Tool id cannot be None.")
-    tool = ToolManager().get_instance_obj(tool_dto.id)
+    tool = _TOOL_MGR.get_instance_obj(tool_dto.id)
     if tool:
         raise ValueError(f"Tool instance corresponding to the tool id already exists. {tool_dto.id}")
     if tool_dto.openapi_schema is None:
@@ -91,7 +94,7 @@ def register_tool(file_path: str):
     component_clz = ComponentConfigerUtil.get_component_object_clz_by_component_configer(tool_configer)
     component_instance: Tool = component_clz().initialize_by_component_configer(tool_configer)
     component_instance.component_config_path = component_configer.configer.path
-    ToolManager().register(component_instance.get_instance_code(), component_instance)
+    _TOOL_MGR.register(component_instance.get_instance_code(), component_instance)
 
 
 def parse_tool_input(openapi: dict) -> list[str]:
@@ -0,0 +1,84 @@
+# !/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# @Time    : 2026/10/15 10:00
+# @Author  : agent
+# @Email   : agent@local
+# @FileName: test_character_text_splitter.py
+import random
+import unittest
+from unittest import mock
+
+from langchain.text_splitter import CharacterTextSplitter as LCCharacterTextSplitter
+
+from agentuniverse.agent.action.knowledge.doc_processor import character_text_splitter
+from agentuniverse.agent.action.knowledge.doc_processor.character_text_splitter import CharacterTextSplitter
+from agentuniverse.agent.action.knowledge.store.document import Document
+
+SEPARATORS = ['\n\n', '\n', ' ', ',', '/n/n', 'ab']
+WORDS = ['a', 'b', 'ab', 'hello', 'world', 'agentUniverse', ' ', '  ', '\n', '\n\n', ',', '/n/n', 'x' * 30]
+
+
+def merge_indices_paths() -> dict:
+    """Return the merge functions to test, the numba one only if numba is installed."""
+    paths = {'python': character_text_splitter._merge_indices}
+    try:
+        from numba import njit
+    except ImportError:
+        return paths
+    paths['numba'] = njit(cache=True)(character_text_splitter._merge_indices)
+    return paths
+
+
+class CharacterTextSplitterTest(unittest.TestCase):
+    """
+    Test cases for CharacterTextSplitter class
+    """
+
+    def assert_same_as_langchain(self, separator: str, chunk_size: int, chunk_overlap: int,
+                                 docs: list) -> None:
+        splitter = CharacterTextSplitter(separator=separator, chunk_size=chunk_size,
+                                         chunk_overlap=chunk_overlap)
+        lc_splitter = LCCharacterTextSplitter(separator=separator, chunk_size=chunk_size,
+                                              chunk_overlap=chunk_overlap)
+        expected = [(doc.page_content, doc.metadata)
+                    for doc in lc_splitter.split_documents(Document.as_langchain_list(docs))]
+        result = [(doc.text, doc.metadata) for doc in splitter.process_docs(docs)]
+        self.assertEqual(result, expected, (separator, chunk_size, chunk_overlap, docs))
+
+    def test_same_as_langchain(self) -> None:
+        for name, merge_indices in merge_indices_paths().items():
+            rand = random.Random(20241015)
+            with self.subTest(path=name), \
+                    mock.patch.object(character_text_splitter, '_get_merge_indices', return_value=merge_indices):
+                for _ in range(500):
+                    chunk_size = rand.randint(1, 60)
+                    chunk_overlap = rand.randint(0, chunk_size)
+                    docs = [Document(text=''.join(rand.choices(WORDS, k=rand.randint(0, 40))),
+                                     metadata={'doc': i})
+                            for i in range(rand.randint(1, 3))]
+                    self.assert_same_as_langchain(rand.choice(SEPARATORS), chunk_size, chunk_overlap, docs)
+
+    def test_multi_document_metadata(self) -> None:
+        docs = [Document(text='one two three four five', metadata={'source': 'a', 'tags': ['x']}),
+                Document(text='', metadata={'source': 'empty'}),
+                Document(text='six seven eight', metadata={'source': 'b', 'tags': ['y']})]
+        for name, merge_indices in merge_indices_paths().items():
+            with self.subTest(path=name), \
+                    mock.patch.object(character_text_splitter, '_get_merge_indices', return_value=merge_indices):
+                self.assert_same_as_langchain(' ', 10, 4, docs)
+                chunks = CharacterTextSplitter(separator=' ', chunk_size=10, chunk_overlap=4).process_docs(docs)
+                self.assertEqual([chunk.metadata['source'] for chunk in chunks], ['a', 'a', 'a', 'b', 'b'])
+                # every chunk owns a copy of the metadata of its document
+                chunks[0].metadata['tags'].append('z')
+                self.assertEqual(chunks[1].metadata['tags'], ['x'])
+                self.assertEqual(docs[0].metadata['tags'], ['x'])
+
+    def test_chunk_overlap_larger_than_chunk_size(self) -> None:
+        splitter = CharacterTextSplitter(separator=' ', chunk_size=5, chunk_overlap=10)
+        with self.assertRaises(ValueError):
+            splitter.process_docs([Document(text='a b c')])
+
+
+if __name__ == '__main__':
+    unittest.main()
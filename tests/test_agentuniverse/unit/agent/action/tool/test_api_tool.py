@@ -0,0 +1,191 @@
+# !/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# @Time    : 2026/10/15 10:00
+# @Author  : agent
+# @Email   : agent@local
+# @FileName: test_api_tool.py
+import asyncio
+import json
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs
+
+import httpx
+
+from agentuniverse.agent.action.tool.api_tool import APITool
+from agentuniverse.agent.action.tool.utils import ssrf_proxy
+from agentuniverse.base.config.component_configer.configers.tool_configer import ToolConfiger
+from agentuniverse.base.config.configer import Configer
+
+BODY_SCHEMA = {
+    'type': 'object',
+    'required': ['count'],
+    'properties': {
+        'count': {'type': 'integer'},
+        'score': {'type': 'number'},
+        'name': {'type': 'string'},
+        'enabled': {'type': 'boolean'},
+        'extra': {'type': 'object'},
+        'flag': {'anyOf': [{'type': 'boolean'}, {'type': 'integer'}]},
+        'note': {'type': 'string', 'default': 'none'},
+    }
+}
+
+PARAMETERS = [
+    {'name': 'item_id', 'in': 'path', 'required': True},
+    {'name': 'q', 'in': 'query', 'required': True},
+    {'name': 'page', 'in': 'query', 'schema': {'default': 1}},
+    {'name': 'lang', 'in': 'query'},
+    {'name': 'X-Trace', 'in': 'header', 'schema': {'default': 'trace'}},
+]
+
+
+def build_tool(content_type: str = 'application/json', parameters: list = None) -> APITool:
+    openapi_spec = {
+        'url': 'http://example.com/items/{item_id}',
+        'method': 'post',
+        'operation': {'parameters': parameters or []},
+        'requestBody': {'content': {content_type: {'schema': BODY_SCHEMA}}},
+    }
+    tool = APITool(name='test_api_tool', description='test api tool', openapi_spec=openapi_spec)
+    tool.compile_openapi_spec()
+    return tool
+
+
+class APIToolTest(unittest.TestCase):
+    """
+    Test cases for APITool class
+    """
+
+    def test_body_keeps_unconvertible_values(self) -> None:
+        tool = build_tool()
+        for value, expected in [('3.0', 3.0), ('2', 2), ('1e3', '1e3'), ('nan', 'nan'), ('inf', 'inf')]:
+            body = tool.build_http_request(tool.openapi_spec['url'], 'post', {},
+                                           {'count': 1, 'score': value})[2]['json']
+            self.assertEqual(repr(body['score']), repr(expected))
+        body = tool.build_http_request(tool.openapi_spec['url'], 'post', {}, {'count': '5.0'})[2]['json']
+        self.assertEqual(body['count'], '5.0')
+
+    def do_request(self, tool: APITool, parameters: dict, method: str = 'post') -> httpx.Request:
+        """Send the request of the tool through a mock transport and return the sent request."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={'ok': True})
+
+        with mock.patch.object(ssrf_proxy, 'client', httpx.Client(transport=httpx.MockTransport(handler))):
+            response = tool.do_http_request(tool.openapi_spec['url'], method, {}, parameters)
+        self.assertEqual(response.json(), {'ok': True})
+        return requests[0]
+
+    def test_path_query_and_header_parameters(self) -> None:
+        tool = build_tool(parameters=PARAMETERS)
+        request = self.do_request(tool, {'item_id': 42, 'q': 'agent', 'count': 1}, method='get')
+        self.assertEqual(request.method, 'GET')
+        self.assertEqual(request.url.path, '/items/42')
+        # defaults are sent, parameters without a value and a default are not
+        self.assertEqual(dict(request.url.params), {'q': 'agent', 'page': '1'})
+        self.assertEqual(request.headers['X-Trace'], 'trace')
+
+        request = self.do_request(tool, {'item_id': 'a b', 'q': 'x', 'page': 3, 'lang': 'en', 'X-Trace': 't1',
+                                         'count': 1})
+        self.assertEqual(request.url.path, '/items/a b')
+        self.assertEqual(dict(request.url.params), {'q': 'x', 'page': '3', 'lang': 'en'})
+        self.assertEqual(request.headers['X-Trace'], 't1')
+
+    def test_missing_required_parameters(self) -> None:
+        tool = build_tool(parameters=PARAMETERS)
+        with self.assertRaisesRegex(Exception, 'Missing required parameter q'):
+            self.do_request(tool, {'item_id': 1, 'count': 1})
+        with self.assertRaisesRegex(Exception, 'Missing required parameter count'):
+            self.do_request(tool, {'item_id': 1, 'q': 'x'})
+
+    def test_json_body(self) -> None:
+        tool = build_tool(parameters=PARAMETERS)
+        request = self.do_request(tool, {'item_id': 1, 'q': 'x', 'count': '2', 'score': '1.5', 'enabled': 'yes',
+                                         'extra': '{"a": 1}', 'flag': 'off', 'unknown': 'dropped'})
+        self.assertEqual(request.headers['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(request.content),
+                         {'count': 2, 'score': 1.5, 'name': None, 'enabled': True, 'extra': {'a': 1},
+                          'flag': False, 'note': 'none'})
+
+    def test_boolean_body_properties(self) -> None:
+        tool = build_tool()
+        for value, expected in [('false', False), ('0', False), ('Off', False), (False, False), (0, False),
+                                ('true', True), ('YES', True), (1, True), (True, True), ('maybe', 'maybe')]:
+            body = tool.convert_body_properties({'count': 1, 'enabled': value, 'flag': value})
+            # the boolean type and the anyOf boolean option convert the same values
+            self.assertEqual(repr(body['enabled']), repr(expected), value)
+            self.assertEqual(repr(body['flag']), repr(expected), value)
+
+    def test_form_body(self) -> None:
+        tool = build_tool(content_type='application/x-www-form-urlencoded')
+        request = self.do_request(tool, {'count': 3, 'name': 'agent universe', 'enabled': 1})
+        self.assertEqual(request.headers['Content-Type'], 'application/x-www-form-urlencoded')
+        self.assertEqual(parse_qs(request.content.decode()),
+                         {'count': ['3'], 'name': ['agent universe'], 'enabled': ['true'], 'note': ['none']})
+
+    def test_other_content_type_body(self) -> None:
+        tool = build_tool(content_type='text/plain')
+        request = self.do_request(tool, {'count': 3})
+        self.assertEqual(request.headers['Content-Type'], 'text/plain')
+        self.assertEqual(parse_qs(request.content.decode()), {'count': ['3'], 'note': ['none']})
+
+    def test_async_request(self) -> None:
+        tool = build_tool(parameters=PARAMETERS)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, text='done')
+
+        async def do_request():
+            async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with mock.patch.object(ssrf_proxy, 'get_async_client', mock.AsyncMock(return_value=async_client)):
+                return await tool.async_do_http_request(tool.openapi_spec['url'], 'put', {},
+                                                        {'item_id': 7, 'q': 'x', 'count': 1})
+
+        response = asyncio.run(do_request())
+        self.assertEqual(response.text, 'done')
+        self.assertEqual(requests[0].method, 'PUT')
+        self.assertEqual(requests[0].url.path, '/items/7')
+        self.assertEqual(json.loads(requests[0].content)['count'], 1)
+
+    def test_spec_without_operation(self) -> None:
+        configer = Configer()
+        configer.value = {'name': 'test_api_tool', 'description': 'test api tool',
+                          'metadata': {'type': 'TOOL', 'module': 'agentuniverse.agent.action.tool.api_tool',
+                                       'class': 'APITool'},
+                          'openapi_spec': {'url': 'http://example.com/ping', 'method': 'get'}}
+        tool = APITool().initialize_by_component_configer(ToolConfiger().load_by_configer(configer))
+        request = self.do_request(tool, {}, method='get')
+        self.assertEqual(str(request.url), 'http://example.com/ping')
+
+    def test_malformed_spec_raises_on_request(self) -> None:
+        configer = Configer()
+        configer.value = {'name': 'test_api_tool', 'description': 'test api tool',
+                          'metadata': {'type': 'TOOL', 'module': 'agentuniverse.agent.action.tool.api_tool',
+                                       'class': 'APITool'},
+                          'openapi_spec': {'url': 'http://example.com/ping', 'method': 'post',
+                                           'operation': {'parameters': [{'name': 'q'}]}}}
+        with mock.patch('agentuniverse.agent.action.tool.api_tool.LOGGER') as logger:
+            tool = APITool().initialize_by_component_configer(ToolConfiger().load_by_configer(configer))
+        logger.warning.assert_called_once()
+        with self.assertRaises(KeyError):
+            self.do_request(tool, {'q': 'x'})
+
+    def test_validate_and_parse_response(self) -> None:
+        parse = APITool.validate_and_parse_response
+        self.assertEqual(parse(httpx.Response(200, content=b'{"a": [1, 2.5]}')), {'a': [1, 2.5]})
+        self.assertEqual(parse(httpx.Response(200, content=b'plain text')), 'plain text')
+        self.assertTrue(parse(httpx.Response(200, content=b'')).startswith('Empty response'))
+        self.assertEqual(APITool.validate_and_parse_response_text(httpx.Response(200, content=b'{"a": 1}')),
+                         '{"a":1}')
+        with self.assertRaises(Exception):
+            parse(httpx.Response(500, content=b'error'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+# !/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# @Time    : 2026/10/15 10:00
+# @Author  : agent
+# @Email   : agent@local
+# @FileName: test_ssrf_proxy.py
+import asyncio
+import unittest
+
+import httpx
+
+from agentuniverse.agent.action.tool.utils import ssrf_proxy
+
+
+class SSRFProxyTest(unittest.TestCase):
+    """
+    Test cases for the shared http clients of ssrf_proxy
+    """
+
+    def test_cookies_are_not_stored(self) -> None:
+        sent_cookies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent_cookies.append(request.headers.get('cookie'))
+            return httpx.Response(200, headers={'set-cookie': 'sid=abc; Path=/'})
+
+        kwargs = ssrf_proxy._client_kwargs(httpx.HTTPTransport)
+        kwargs.pop('mounts', None)
+        kwargs.pop('proxy', None)
+        client = httpx.Client(transport=httpx.MockTransport(handler), **kwargs)
+        client.get('http://example.com/')
+        client.get('http://example.com/')
+        self.assertEqual(sent_cookies, [None, None])
+        self.assertEqual(len(client.cookies.jar), 0)
+
+    def test_async_client_closed_with_loop(self) -> None:
+        async def get_clients():
+            return await ssrf_proxy.get_async_client(), await ssrf_proxy.get_async_client()
+
+        first, second = asyncio.run(get_clients())
+        self.assertIs(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertEqual(ssrf_proxy._async_clients, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
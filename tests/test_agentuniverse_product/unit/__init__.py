@@ -0,0 +1,7 @@
+# !/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# @Time    : 2026/10/15 14:00
+# @Author  : agent
+# @Email   : agent@local
+# @FileName: __init__.py
@@ -0,0 +1,78 @@
+# !/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# @Time    : 2026/10/15 14:00
+# @Author  : agent
+# @Email   : agent@local
+# @FileName: test_product_manager.py
+import unittest
+
+from agentuniverse_product.base.product import Product
+from agentuniverse_product.base.product_manager import ProductManager
+
+PRODUCT_TYPE = 'TEST_PRODUCT_INDEX'
+
+
+def instance_code(product_id: str) -> str:
+    return f'test_app.product.{product_id}'
+
+
+class ProductManagerTest(unittest.TestCase):
+    """
+    Test cases for the product type index and the version of ProductManager
+    """
+
+    def setUp(self) -> None:
+        self.product_manager = ProductManager()
+        self.registered = []
+
+    def tearDown(self) -> None:
+        for name in self.registered:
+            if name in self.product_manager.get_instance_name_list():
+                self.product_manager.unregister(name)
+        self.product_manager._instance_obj_map.pop('__default_instance__', None)
+
+    def register(self, product: Product) -> None:
+        self.product_manager.register(instance_code(product.id), product)
+        self.registered.append(instance_code(product.id))
+
+    def test_register_and_unregister_by_type(self) -> None:
+        first = Product(id='test_index_first', type=PRODUCT_TYPE)
+        second = Product(id='test_index_second', type=PRODUCT_TYPE)
+        other = Product(id='test_index_other', type=f'{PRODUCT_TYPE}_OTHER')
+        self.register(first)
+        self.register(second)
+        self.register(other)
+        self.assertEqual(self.product_manager.get_instance_obj_list_by_type(PRODUCT_TYPE), [first, second])
+        self.assertEqual(self.product_manager.get_instance_obj_list_by_type(f'{PRODUCT_TYPE}_OTHER'), [other])
+
+        self.product_manager.unregister(instance_code(first.id))
+        self.assertEqual(self.product_manager.get_instance_obj_list_by_type(PRODUCT_TYPE), [second])
+        self.product_manager.unregister(instance_code(second.id))
+        self.assertEqual(self.product_manager.get_instance_obj_list_by_type(PRODUCT_TYPE), [])
+        self.assertEqual(self.product_manager.get_instance_obj_list_by_type('TEST_PRODUCT_UNKNOWN'), [])
+
+    def test_default_product_listed_once(self) -> None:
+        default = Product(id='test_index_default', type=PRODUCT_TYPE, default_symbol=True)
+        self.register(default)
+        self.assertIs(self.product_manager._instance_obj_map['__default_instance__'], default)
+        self.assertEqual(self.product_manager.get_instance_obj_list_by_type(PRODUCT_TYPE), [default])
+
+    def test_version_increases_on_change(self) -> None:
+        product = Product(id='test_index_version', type=PRODUCT_TYPE)
+        version = self.product_manager.version
+        self.register(product)
+        self.assertEqual(self.product_manager.version, version + 1)
+        self.product_manager.increase_version()
+        self.assertEqual(self.product_manager.version, version + 2)
+        self.product_manager.unregister(instance_code(product.id))
+        self.assertEqual(self.product_manager.version, version + 3)
+        # a failed register does not change the product pool
+        self.register(product)
+        with self.assertRaises(ValueError):
+            self.product_manager.register(instance_code(product.id), product)
+        self.assertEqual(self.product_manager.version, version + 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
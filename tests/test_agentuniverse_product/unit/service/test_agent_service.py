@@ -0,0 +1,97 @@
+# !/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# @Time    : 2026/10/15 14:00
+# @Author  : agent
+# @Email   : agent@local
+# @FileName: test_agent_service.py
+import unittest
+from unittest import mock
+
+from agentuniverse_product.base.product import Product
+from agentuniverse_product.base.product_manager import ProductManager
+from agentuniverse_product.service.agent_service import agent_service
+from agentuniverse_product.service.agent_service.agent_service import AgentService
+from agentuniverse_product.service.knowledge_service.knowledge_service import KnowledgeService
+from agentuniverse_product.service.model.agent_dto import AgentDTO
+from agentuniverse_product.service.model.knowledge_dto import KnowledgeDTO
+from agentuniverse_product.service.model.tool_dto import ToolDTO
+
+AGENT_ID = 'test_detail_cache_agent'
+
+
+class AgentServiceTest(unittest.TestCase):
+    """
+    Test cases for the agent detail cache of AgentService
+    """
+
+    def setUp(self) -> None:
+        agent_service._DETAIL_CACHE.clear()
+        self.build_count = 0
+        self.description = 'description'
+        patcher = mock.patch.object(AgentService, 'build_agent_detail', side_effect=self.build_agent_detail)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(agent_service._DETAIL_CACHE.clear)
+
+    def build_agent_detail(self, id: str) -> AgentDTO:
+        self.build_count += 1
+        return AgentDTO(id=id, description=self.description, tool=[ToolDTO(id='tool')])
+
+    def test_cache_hit_returns_copy(self) -> None:
+        agent_dto = AgentService.get_agent_detail(AGENT_ID)
+        agent_dto.description = 'changed'
+        agent_dto.tool.append(ToolDTO(id='other_tool'))
+
+        cached_dto = AgentService.get_agent_detail(AGENT_ID)
+        self.assertEqual(self.build_count, 1)
+        self.assertIsNot(cached_dto, agent_dto)
+        self.assertEqual(cached_dto.description, 'description')
+        self.assertEqual([tool.id for tool in cached_dto.tool], ['tool'])
+
+    def test_register_and_unregister_invalidate(self) -> None:
+        product_manager = ProductManager()
+        instance_code = 'test_app.product.test_detail_cache_product'
+        AgentService.get_agent_detail(AGENT_ID)
+        product_manager.register(instance_code, Product(id='test_detail_cache_product', type='TEST_CACHE'))
+        AgentService.get_agent_detail(AGENT_ID)
+        self.assertEqual(self.build_count, 2)
+        product_manager.unregister(instance_code)
+        AgentService.get_agent_detail(AGENT_ID)
+        self.assertEqual(self.build_count, 3)
+        AgentService.get_agent_detail(AGENT_ID)
+        self.assertEqual(self.build_count, 3)
+
+    def test_update_agent_invalidates_when_write_fails(self) -> None:
+        self.assertEqual(AgentService.get_agent_detail(AGENT_ID).description, 'description')
+        agent = mock.MagicMock()
+        agent.agent_model.info = {'description': 'description'}
+        with mock.patch.object(agent_service._AGENT_MGR, 'get_instance_obj', return_value=agent), \
+                mock.patch.object(agent_service._PRODUCT_MGR, 'get_instance_obj', return_value=None), \
+                mock.patch('agentuniverse_product.service.util.agent_util.update_nested_yaml_value',
+                           side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                AgentService.update_agent(AgentDTO(id=AGENT_ID, description='updated', tool=None, knowledge=None))
+        # the agent instance is updated in memory, so its cached detail is rebuilt
+        self.assertEqual(agent.agent_model.info['description'], 'updated')
+        self.description = 'updated'
+        self.assertEqual(AgentService.get_agent_detail(AGENT_ID).description, 'updated')
+        self.assertEqual(self.build_count, 2)
+
+    def test_update_knowledge_invalidates_when_write_fails(self) -> None:
+        AgentService.get_agent_detail(AGENT_ID)
+        knowledge_manager = mock.MagicMock()
+        with mock.patch('agentuniverse_product.service.knowledge_service.knowledge_service.KnowledgeManager',
+                        return_value=knowledge_manager), \
+                mock.patch.object(ProductManager(), 'get_instance_obj', return_value=mock.MagicMock()), \
+                mock.patch('agentuniverse_product.service.knowledge_service.knowledge_service.'
+                           'update_nested_yaml_value', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                KnowledgeService.update_knowledge(KnowledgeDTO(id='test_knowledge', description='updated'))
+        self.assertEqual(knowledge_manager.get_instance_obj.return_value.description, 'updated')
+        AgentService.get_agent_detail(AGENT_ID)
+        self.assertEqual(self.build_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()